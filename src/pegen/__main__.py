@@ -124,7 +124,7 @@ def main() -> None:
             print()
         print("Caches sizes:")
         print(f"  token array : {len(tokenizer._tokens):10}")
-        print(f"        cache : {len(parser._cache):10}")
+        print(f"        cache : {parser.cache_size():10}")
 
 
 if __name__ == "__main__":
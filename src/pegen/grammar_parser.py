@@ -44,7 +44,7 @@ class GeneratedParser(Parser):
     def start(self) -> Optional[Grammar]:
         # start: grammar $
         mark = self._mark()
-        if (grammar := self.grammar()) and (_endmarker := self.expect("ENDMARKER")):
+        if (grammar := self.grammar()) and (_endmarker := self._expect_ENDMARKER()):
             return grammar
         self._reset(mark)
         return None
@@ -78,25 +78,25 @@ class GeneratedParser(Parser):
         # meta: "@" NAME NEWLINE | "@" NAME NAME NEWLINE | "@" NAME STRING NEWLINE
         mark = self._mark()
         if (
-            (literal := self.expect("@"))
+            (literal := self._expect_AT())
             and (name := self.name())
-            and (_newline := self.expect("NEWLINE"))
+            and (_newline := self._expect_NEWLINE())
         ):
             return (name.string, None)
         self._reset(mark)
         if (
-            (literal := self.expect("@"))
+            (literal := self._expect_AT())
             and (a := self.name())
             and (b := self.name())
-            and (_newline := self.expect("NEWLINE"))
+            and (_newline := self._expect_NEWLINE())
         ):
             return (a.string, b.string)
         self._reset(mark)
         if (
-            (literal := self.expect("@"))
+            (literal := self._expect_AT())
             and (name := self.name())
             and (string := self.string())
-            and (_newline := self.expect("NEWLINE"))
+            and (_newline := self._expect_NEWLINE())
         ):
             return (name.string, literal_eval(string.string))
         self._reset(mark)
@@ -121,32 +121,32 @@ class GeneratedParser(Parser):
         if (
             (rulename := self.rulename())
             and (opt := self.memoflag(),)
-            and (literal := self.expect(":"))
+            and (literal := self._expect_COLON())
             and (alts := self.alts())
-            and (_newline := self.expect("NEWLINE"))
-            and (_indent := self.expect("INDENT"))
+            and (_newline := self._expect_NEWLINE())
+            and (_indent := self._expect_INDENT())
             and (more_alts := self.more_alts())
-            and (_dedent := self.expect("DEDENT"))
+            and (_dedent := self._expect_DEDENT())
         ):
             return Rule(rulename[0], rulename[1], Rhs(alts.alts + more_alts.alts), memo=opt)
         self._reset(mark)
         if (
             (rulename := self.rulename())
             and (opt := self.memoflag(),)
-            and (literal := self.expect(":"))
-            and (_newline := self.expect("NEWLINE"))
-            and (_indent := self.expect("INDENT"))
+            and (literal := self._expect_COLON())
+            and (_newline := self._expect_NEWLINE())
+            and (_indent := self._expect_INDENT())
             and (more_alts := self.more_alts())
-            and (_dedent := self.expect("DEDENT"))
+            and (_dedent := self._expect_DEDENT())
         ):
             return Rule(rulename[0], rulename[1], more_alts, memo=opt)
         self._reset(mark)
         if (
             (rulename := self.rulename())
             and (opt := self.memoflag(),)
-            and (literal := self.expect(":"))
+            and (literal := self._expect_COLON())
             and (alts := self.alts())
-            and (_newline := self.expect("NEWLINE"))
+            and (_newline := self._expect_NEWLINE())
         ):
             return Rule(rulename[0], rulename[1], alts, memo=opt)
         self._reset(mark)
@@ -169,9 +169,9 @@ class GeneratedParser(Parser):
         # memoflag: '(' "memo" ')'
         mark = self._mark()
         if (
-            (literal := self.expect("("))
-            and (literal_1 := self.expect("memo"))
-            and (literal_2 := self.expect(")"))
+            (literal := self._expect_LPAR())
+            and (literal_1 := self._expect_memo())
+            and (literal_2 := self._expect_RPAR())
         ):
             return "memo"
         self._reset(mark)
@@ -181,7 +181,7 @@ class GeneratedParser(Parser):
     def alts(self) -> Optional[Rhs]:
         # alts: alt "|" alts | alt
         mark = self._mark()
-        if (alt := self.alt()) and (literal := self.expect("|")) and (alts := self.alts()):
+        if (alt := self.alt()) and (literal := self._expect_VBAR()) and (alts := self.alts()):
             return Rhs([alt] + alts.alts)
         self._reset(mark)
         if alt := self.alt():
@@ -194,17 +194,17 @@ class GeneratedParser(Parser):
         # more_alts: "|" alts NEWLINE more_alts | "|" alts NEWLINE
         mark = self._mark()
         if (
-            (literal := self.expect("|"))
+            (literal := self._expect_VBAR())
             and (alts := self.alts())
-            and (_newline := self.expect("NEWLINE"))
+            and (_newline := self._expect_NEWLINE())
             and (more_alts := self.more_alts())
         ):
             return Rhs(alts.alts + more_alts.alts)
         self._reset(mark)
         if (
-            (literal := self.expect("|"))
+            (literal := self._expect_VBAR())
             and (alts := self.alts())
-            and (_newline := self.expect("NEWLINE"))
+            and (_newline := self._expect_NEWLINE())
         ):
             return Rhs(alts.alts)
         self._reset(mark)
@@ -248,7 +248,7 @@ class GeneratedParser(Parser):
         if (
             (name := self.name())
             and (annotation := self.annotation())
-            and (literal := self.expect("="))
+            and (literal := self._expect_EQUAL())
             and (cut := True)
             and (item := self.item())
         ):
@@ -259,7 +259,7 @@ class GeneratedParser(Parser):
         cut = False
         if (
             (name := self.name())
-            and (literal := self.expect("="))
+            and (literal := self._expect_EQUAL())
             and (cut := True)
             and (item := self.item())
         ):
@@ -284,8 +284,8 @@ class GeneratedParser(Parser):
         mark = self._mark()
         cut = False
         if (
-            (literal := self.expect("&"))
-            and (literal_1 := self.expect("&"))
+            (literal := self._expect_AMPER())
+            and (literal_1 := self._expect_AMPER())
             and (cut := True)
             and (atom := self.atom())
         ):
@@ -300,7 +300,7 @@ class GeneratedParser(Parser):
         # lookahead: '&' ~ atom | '!' ~ atom | '~'
         mark = self._mark()
         cut = False
-        if (literal := self.expect("&")) and (cut := True) and (atom := self.atom()):
+        if (literal := self._expect_AMPER()) and (cut := True) and (atom := self.atom()):
             return PositiveLookahead(atom)
         self._reset(mark)
         if cut:
@@ -311,7 +311,7 @@ class GeneratedParser(Parser):
         self._reset(mark)
         if cut:
             return None
-        if literal := self.expect("~"):
+        if literal := self._expect_TILDE():
             return Cut()
         self._reset(mark)
         return None
@@ -322,10 +322,10 @@ class GeneratedParser(Parser):
         mark = self._mark()
         cut = False
         if (
-            (literal := self.expect("["))
+            (literal := self._expect_LSQB())
             and (cut := True)
             and (alts := self.alts())
-            and (literal_1 := self.expect("]"))
+            and (literal_1 := self._expect_RSQB())
         ):
             return Opt(alts)
         self._reset(mark)
@@ -334,17 +334,17 @@ class GeneratedParser(Parser):
         if (atom := self.atom()) and (literal := self.expect("?")):
             return Opt(atom)
         self._reset(mark)
-        if (atom := self.atom()) and (literal := self.expect("*")):
+        if (atom := self.atom()) and (literal := self._expect_STAR()):
             return Repeat0(atom)
         self._reset(mark)
-        if (atom := self.atom()) and (literal := self.expect("+")):
+        if (atom := self.atom()) and (literal := self._expect_PLUS()):
             return Repeat1(atom)
         self._reset(mark)
         if (
             (sep := self.atom())
-            and (literal := self.expect("."))
+            and (literal := self._expect_DOT())
             and (node := self.atom())
-            and (literal_1 := self.expect("+"))
+            and (literal_1 := self._expect_PLUS())
         ):
             return Gather(sep, node)
         self._reset(mark)
@@ -359,10 +359,10 @@ class GeneratedParser(Parser):
         mark = self._mark()
         cut = False
         if (
-            (literal := self.expect("("))
+            (literal := self._expect_LPAR())
             and (cut := True)
             and (alts := self.alts())
-            and (literal_1 := self.expect(")"))
+            and (literal_1 := self._expect_RPAR())
         ):
             return Group(alts)
         self._reset(mark)
@@ -382,10 +382,10 @@ class GeneratedParser(Parser):
         mark = self._mark()
         cut = False
         if (
-            (literal := self.expect("{"))
+            (literal := self._expect_LBRACE())
             and (cut := True)
             and (target_atoms := self.target_atoms())
-            and (literal_1 := self.expect("}"))
+            and (literal_1 := self._expect_RBRACE())
         ):
             return target_atoms
         self._reset(mark)
@@ -399,10 +399,10 @@ class GeneratedParser(Parser):
         mark = self._mark()
         cut = False
         if (
-            (literal := self.expect("["))
+            (literal := self._expect_LSQB())
             and (cut := True)
             and (target_atoms := self.target_atoms())
-            and (literal_1 := self.expect("]"))
+            and (literal_1 := self._expect_RSQB())
         ):
             return target_atoms
         self._reset(mark)
@@ -428,10 +428,10 @@ class GeneratedParser(Parser):
         mark = self._mark()
         cut = False
         if (
-            (literal := self.expect("{"))
+            (literal := self._expect_LBRACE())
             and (cut := True)
             and (atoms := self.target_atoms(),)
-            and (literal_1 := self.expect("}"))
+            and (literal_1 := self._expect_RBRACE())
         ):
             return "{" + (atoms or "") + "}"
         self._reset(mark)
@@ -439,16 +439,16 @@ class GeneratedParser(Parser):
             return None
         cut = False
         if (
-            (literal := self.expect("["))
+            (literal := self._expect_LSQB())
             and (cut := True)
             and (atoms := self.target_atoms(),)
-            and (literal_1 := self.expect("]"))
+            and (literal_1 := self._expect_RSQB())
         ):
             return "[" + (atoms or "") + "]"
         self._reset(mark)
         if cut:
             return None
-        if (name := self.name()) and (literal := self.expect("*")):
+        if (name := self.name()) and (literal := self._expect_STAR()):
             return name.string + "*"
         self._reset(mark)
         if name := self.name():
@@ -463,18 +463,39 @@ class GeneratedParser(Parser):
         if literal := self.expect("?"):
             return "?"
         self._reset(mark)
-        if literal := self.expect(":"):
+        if literal := self._expect_COLON():
             return ":"
         self._reset(mark)
         if (
-            self.negative_lookahead(self.expect, "}")
-            and self.negative_lookahead(self.expect, "]")
+            self.negative_lookahead(self._expect_RBRACE)
+            and self.negative_lookahead(self._expect_RSQB)
             and (op := self.op())
         ):
             return op.string
         self._reset(mark)
         return None
 
+    _expect_AMPER = Parser._bind_expect("&")
+    _expect_AT = Parser._bind_expect("@")
+    _expect_COLON = Parser._bind_expect(":")
+    _expect_DEDENT = Parser._bind_expect("DEDENT")
+    _expect_DOT = Parser._bind_expect(".")
+    _expect_ENDMARKER = Parser._bind_expect("ENDMARKER")
+    _expect_EQUAL = Parser._bind_expect("=")
+    _expect_INDENT = Parser._bind_expect("INDENT")
+    _expect_LBRACE = Parser._bind_expect("{")
+    _expect_LPAR = Parser._bind_expect("(")
+    _expect_LSQB = Parser._bind_expect("[")
+    _expect_NEWLINE = Parser._bind_expect("NEWLINE")
+    _expect_PLUS = Parser._bind_expect("+")
+    _expect_RBRACE = Parser._bind_expect("}")
+    _expect_RPAR = Parser._bind_expect(")")
+    _expect_RSQB = Parser._bind_expect("]")
+    _expect_STAR = Parser._bind_expect("*")
+    _expect_TILDE = Parser._bind_expect("~")
+    _expect_VBAR = Parser._bind_expect("|")
+    _expect_memo = Parser._bind_expect("memo")
+
     KEYWORDS = ()
     SOFT_KEYWORDS = ("memo",)
 
@@ -1,14 +1,38 @@
 import argparse
+import itertools
 import sys
 import time
 import token
 import tokenize
 import traceback
+import types
 from abc import abstractmethod
-from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Type, TypeVar, cast
+from token import NAME, NUMBER, OP, STRING, TYPE_COMMENT
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from pegen.tokenizer import Mark, Tokenizer, exact_token_types
 
+# Token names that expect() matches by token type, such as NEWLINE.  Every
+# other string, operators included, is matched against the token's string,
+# since the tokenize module reports every operator as OP.
+_EXPECT_BY_TYPE: Dict[str, int] = {
+    name: value
+    for name, value in token.__dict__.items()
+    if isinstance(value, int) and name not in exact_token_types
+}
+
 T = TypeVar("T")
 P = TypeVar("P", bound="Parser")
 F = TypeVar("F", bound=Callable[..., Any])
@@ -22,9 +46,7 @@ def logger(method: F) -> F:
     method_name = method.__name__
 
     def logger_wrapper(self: P, *args: object) -> T:
-        if not self._verbose:
-            return method(self, *args)
-        argsr = ",".join(repr(arg) for arg in args)
+        argsr = ",".join(map(repr, args)) if args else ""
         fill = "  " * self._level
         print(f"{fill}{method_name}({argsr}) .... (looking at {self.showpeek()})")
         self._level += 1
@@ -33,81 +55,213 @@ def logger(method: F) -> F:
         print(f"{fill}... {method_name}({argsr}) --> {tree!s:.200}")
         return tree
 
-    logger_wrapper.__wrapped__ = method  # type: ignore
-    return cast(F, logger_wrapper)
+    # Non-verbose parsers call the method directly; see Parser._bind_verbose_rules().
+    method._verbose_variant = logger_wrapper  # type: ignore
+    return method
+
+
+# Sentinel for memo entries that have not been computed yet.
+_MISS: Any = object()
+# Default for argument-keyed lookups, which still store (tree, endmark) pairs.
+_MISS_ENTRY = None, _MISS
 
 
 def memoize(method: F) -> F:
-    """Memoize a symbol method."""
-    method_name = method.__name__
+    """Memoize a symbol method.
 
-    def memoize_wrapper(self: P, *args: object) -> T:
-        mark = self._mark()
-        key = mark, method_name, args
-        # Fast path: cache hit, and not verbose.
-        if key in self._cache and not self._verbose:
-            tree, endmark = self._cache[key]
-            self._reset(endmark)
+    Calls without arguments are cached in a per-position row holding a
+    tree slot and an end mark slot per rule; calls with arguments go
+    through a per-position dict.  So do calls to rules attached to a class
+    after it was created, which have no slot in the rows.
+    """
+    # Interned so the (method_name, args) keys hash and compare quickly.
+    method_name = sys.intern(method.__name__)
+    # Assigned by _number_memoized_rules(); until then the slots point at the
+    # guard pair at the end of every memo row, which is never filled.
+    tree_slot, end_slot = -2, -1
+
+    def keyed_call(self: P, tokenizer: Tokenizer, mark: Mark, args: Tuple[object, ...]) -> Any:
+        key = method_name, args
+        cache = self._cache
+        entries = cache[mark] if mark < len(cache) else None
+        tree, endmark = entries.get(key, _MISS_ENTRY) if entries else _MISS_ENTRY
+        if endmark is not _MISS:
+            if tokenizer._verbose:
+                tokenizer.reset(endmark)
+            else:
+                tokenizer._index = endmark
             return tree
-        # Slow path: no cache hit, or verbose.
-        verbose = self._verbose
-        argsr = ",".join(repr(arg) for arg in args)
+        tree = method(self, *args)
+        self._cache_at(mark)[key] = tree, tokenizer._index
+        return tree
+
+    def memoize_wrapper(self: P, *args: object) -> Any:
+        tokenizer = self._tokenizer
+        mark = tokenizer._index
+        if args:
+            return keyed_call(self, tokenizer, mark, args)
+        memo = self._memo
+        if mark < len(memo):
+            row = memo[mark]
+            endmark = row[end_slot]
+            if endmark is not _MISS:
+                if tokenizer._verbose:
+                    tokenizer.reset(endmark)
+                else:
+                    tokenizer._index = endmark
+                return row[tree_slot]
+        if end_slot < 0:
+            return keyed_call(self, tokenizer, mark, args)
+        tree = method(self)
+        row = self._memo_row(mark)
+        row[tree_slot] = tree
+        row[end_slot] = tokenizer._index
+        return tree
+
+    def memoize_verbose_wrapper(self: P, *args: object) -> Any:
+        mark = self._mark()
+        keyed = bool(args) or end_slot < 0
+        if keyed:
+            key = method_name, args
+            cache = self._cache
+            entries = cache[mark] if mark < len(cache) else None
+            tree, endmark = entries.get(key, _MISS_ENTRY) if entries else _MISS_ENTRY
+        else:
+            memo = self._memo
+            if mark < len(memo):
+                row = memo[mark]
+                tree = row[tree_slot]
+                endmark = row[end_slot]
+            else:
+                endmark = _MISS
+        argsr = ",".join(map(repr, args)) if args else ""
         fill = "  " * self._level
-        if key not in self._cache:
-            if verbose:
-                print(f"{fill}{method_name}({argsr}) ... (looking at {self.showpeek()})")
+        if endmark is _MISS:
+            print(f"{fill}{method_name}({argsr}) ... (looking at {self.showpeek()})")
             self._level += 1
             tree = method(self, *args)
             self._level -= 1
-            if verbose:
-                print(f"{fill}... {method_name}({argsr}) -> {tree!s:.200}")
+            print(f"{fill}... {method_name}({argsr}) -> {tree!s:.200}")
             endmark = self._mark()
-            self._cache[key] = tree, endmark
+            if keyed:
+                self._cache_at(mark)[key] = tree, endmark
+            else:
+                row = self._memo_row(mark)
+                row[tree_slot] = tree
+                row[end_slot] = endmark
         else:
-            tree, endmark = self._cache[key]
-            if verbose:
-                print(f"{fill}{method_name}({argsr}) -> {tree!s:.200}")
+            print(f"{fill}{method_name}({argsr}) -> {tree!s:.200}")
             self._reset(endmark)
         return tree
 
+    def set_rule_id(value: int) -> None:
+        nonlocal tree_slot, end_slot
+        memoize_wrapper._rule_id = value  # type: ignore
+        tree_slot = 2 * value
+        end_slot = tree_slot + 1
+
     memoize_wrapper.__wrapped__ = method  # type: ignore
+    memoize_wrapper._rule_id = -1  # type: ignore
+    memoize_wrapper._set_rule_id = set_rule_id  # type: ignore
+    memoize_wrapper._decorator = memoize  # type: ignore
+    memoize_wrapper._verbose_variant = memoize_verbose_wrapper  # type: ignore
     return cast(F, memoize_wrapper)
 
 
 def memoize_left_rec(method: Callable[[P], Optional[T]]) -> Callable[[P], Optional[T]]:
     """Memoize a left-recursive symbol method."""
     method_name = method.__name__
+    # Assigned by _number_memoized_rules(); until then the slots point at the
+    # guard pair at the end of every memo row, which is never filled.
+    tree_slot, end_slot = -2, -1
+
+    # For left-recursive rules we manipulate the cache and
+    # loop until the rule shows no progress, then pick the
+    # previous result.  For an explanation why this works, see
+    # https://github.com/PhilippeSigaud/Pegged/wiki/Left-Recursion
+    # (But we use the memoization cache instead of a static
+    # variable; perhaps this is similar to a paper by Warth et al.
+    # (http://web.cs.ucla.edu/~todd/research/pub.php?id=pepm08).
 
     def memoize_left_rec_wrapper(self: P) -> Optional[T]:
+        tokenizer = self._tokenizer
+        mark = tokenizer._index
+        memo = self._memo
+        if mark < len(memo):
+            row = memo[mark]
+            endmark = row[end_slot]
+            if endmark is not _MISS:
+                if tokenizer._verbose:
+                    tokenizer.reset(endmark)
+                else:
+                    tokenizer._index = endmark
+                return row[tree_slot]
+        if end_slot >= 0:
+            row = self._memo_row(mark)
+            tree_key, end_key = tree_slot, end_slot
+        else:
+            # Attached to its class after the class was created, so there is
+            # no slot in the rows; keep its entry in the per-position dict.
+            row = self._left_rec_entry(mark, method_name)
+            tree_key, end_key = 0, 1
+            endmark = row[end_key]
+            if endmark is not _MISS:
+                if tokenizer._verbose:
+                    tokenizer.reset(endmark)
+                else:
+                    tokenizer._index = endmark
+                return row[tree_key]
+
+        # Prime the cache with a failure.
+        row[tree_key] = None
+        row[end_key] = mark
+        lastresult, lastmark = None, mark
+
+        reset = self._reset
+        while True:
+            reset(mark)
+            self.in_recursive_rule += 1
+            try:
+                result = method(self)
+            finally:
+                self.in_recursive_rule -= 1
+            endmark = tokenizer._index
+            if not result or endmark <= lastmark:
+                break
+            row[tree_key] = lastresult = result
+            row[end_key] = lastmark = endmark
+
+        reset(lastmark)
+        tree = lastresult
+        if tree:
+            endmark = tokenizer._index
+        else:
+            endmark = mark
+            reset(endmark)
+        row[tree_key] = tree
+        row[end_key] = endmark
+        return tree
+
+    def memoize_left_rec_verbose_wrapper(self: P) -> Optional[T]:
         mark = self._mark()
-        key = mark, method_name, ()
-        # Fast path: cache hit, and not verbose.
-        if key in self._cache and not self._verbose:
-            tree, endmark = self._cache[key]
-            self._reset(endmark)
-            return tree
-        # Slow path: no cache hit, or verbose.
-        verbose = self._verbose
+        if end_slot >= 0:
+            row = self._memo_row(mark)
+            tree_key, end_key = tree_slot, end_slot
+        else:
+            row = self._left_rec_entry(mark, method_name)
+            tree_key, end_key = 0, 1
+        endmark = row[end_key]
         fill = "  " * self._level
-        if key not in self._cache:
-            if verbose:
-                print(f"{fill}{method_name} ... (looking at {self.showpeek()})")
+        if endmark is _MISS:
+            print(f"{fill}{method_name} ... (looking at {self.showpeek()})")
             self._level += 1
 
-            # For left-recursive rules we manipulate the cache and
-            # loop until the rule shows no progress, then pick the
-            # previous result.  For an explanation why this works, see
-            # https://github.com/PhilippeSigaud/Pegged/wiki/Left-Recursion
-            # (But we use the memoization cache instead of a static
-            # variable; perhaps this is similar to a paper by Warth et al.
-            # (http://web.cs.ucla.edu/~todd/research/pub.php?id=pepm08).
-
             # Prime the cache with a failure.
-            self._cache[key] = None, mark
+            row[tree_key] = None
+            row[end_key] = mark
             lastresult, lastmark = None, mark
             depth = 0
-            if verbose:
-                print(f"{fill}Recursive {method_name} at {mark} depth {depth}")
+            print(f"{fill}Recursive {method_name} at {mark} depth {depth}")
 
             while True:
                 self._reset(mark)
@@ -118,44 +272,104 @@ def memoize_left_rec(method: Callable[[P], Optional[T]]) -> Callable[[P], Option
                     self.in_recursive_rule -= 1
                 endmark = self._mark()
                 depth += 1
-                if verbose:
-                    print(
-                        f"{fill}Recursive {method_name} at {mark} depth {depth}: {result!s:.200} to {endmark}"
-                    )
+                print(
+                    f"{fill}Recursive {method_name} at {mark} depth {depth}: {result!s:.200} to {endmark}"
+                )
                 if not result:
-                    if verbose:
-                        print(f"{fill}Fail with {lastresult!s:.200} to {lastmark}")
+                    print(f"{fill}Fail with {lastresult!s:.200} to {lastmark}")
                     break
                 if endmark <= lastmark:
-                    if verbose:
-                        print(f"{fill}Bailing with {lastresult!s:.200} to {lastmark}")
+                    print(f"{fill}Bailing with {lastresult!s:.200} to {lastmark}")
                     break
-                self._cache[key] = lastresult, lastmark = result, endmark
+                row[tree_key] = lastresult = result
+                row[end_key] = lastmark = endmark
 
             self._reset(lastmark)
             tree = lastresult
 
             self._level -= 1
-            if verbose:
-                print(f"{fill}{method_name}() -> {tree!s:.200} [cached]")
+            print(f"{fill}{method_name}() -> {tree!s:.200} [cached]")
             if tree:
                 endmark = self._mark()
             else:
                 endmark = mark
                 self._reset(endmark)
-            self._cache[key] = tree, endmark
+            row[tree_key] = tree
+            row[end_key] = endmark
         else:
-            tree, endmark = self._cache[key]
-            if verbose:
-                print(f"{fill}{method_name}() -> {tree!s:.200} [fresh]")
+            tree = row[tree_key]
+            print(f"{fill}{method_name}() -> {tree!s:.200} [fresh]")
             if tree:
                 self._reset(endmark)
         return tree
 
+    def set_rule_id(value: int) -> None:
+        nonlocal tree_slot, end_slot
+        memoize_left_rec_wrapper._rule_id = value  # type: ignore
+        tree_slot = 2 * value
+        end_slot = tree_slot + 1
+
     memoize_left_rec_wrapper.__wrapped__ = method  # type: ignore
+    memoize_left_rec_wrapper._rule_id = -1  # type: ignore
+    memoize_left_rec_wrapper._set_rule_id = set_rule_id  # type: ignore
+    memoize_left_rec_wrapper._decorator = memoize_left_rec  # type: ignore
+    memoize_left_rec_wrapper._verbose_variant = memoize_left_rec_verbose_wrapper  # type: ignore
     return memoize_left_rec_wrapper
 
 
+def _number_memoized_rules(cls: Type[Any]) -> None:
+    """Give every memoized rule *cls* can reach a slot in the ``Parser._memo`` rows.
+
+    Rules defined on *cls* take the lowest ids not used by any rule reachable
+    through its MRO, so rows only grow with the rules the class can see.
+    Rules from mixins, and rules whose id clashes with another reachable rule
+    (which multiple inheritance can cause), are copied onto *cls* under a
+    fresh id.
+    """
+    # The first definition of a name along the MRO is the one cls sees.
+    visible: Dict[str, Any] = {}
+    # Every memoized rule reachable from cls, including those only reachable
+    # through super(), mapped to the class defining it.
+    reachable: Dict[Any, type] = {}
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            visible.setdefault(name, value)
+            if getattr(value, "_rule_id", None) is not None:
+                reachable.setdefault(value, klass)
+
+    # Rules only reachable through super() cannot be copied, so they claim
+    # their ids first.
+    visible_ids = {id(value) for value in visible.values()}
+    owners: Dict[int, Any] = {}
+    pending = []
+    for rule, klass in sorted(reachable.items(), key=lambda item: id(item[0]) in visible_ids):
+        rule_id = rule._rule_id
+        if rule_id == -1 and klass is cls:
+            pending.append(rule)
+            continue
+        if rule_id != -1 and owners.setdefault(rule_id, rule) is rule:
+            continue
+        names = [name for name, value in visible.items() if value is rule]
+        if not names and rule_id != -1:
+            raise TypeError(
+                f"{cls.__name__}: memoized rule {rule.__wrapped__.__name__!r} shares a memo "
+                f"slot with {owners[rule_id].__wrapped__.__name__!r} and cannot be renumbered "
+                "because both are only reachable through super()"
+            )
+        for name in names:
+            copy = rule._decorator(rule.__wrapped__)
+            setattr(cls, name, copy)
+            pending.append(copy)
+
+    free_ids = (i for i in itertools.count() if i not in owners)
+    count = max(owners, default=-1) + 1
+    for rule in pending:
+        rule_id = next(free_ids)
+        rule._set_rule_id(rule_id)
+        count = max(count, rule_id + 1)
+    cls._memo_rule_count = count
+
+
 class Parser:
     """Parsing base class."""
 
@@ -163,11 +377,41 @@ class Parser:
 
     SOFT_KEYWORDS: ClassVar[Tuple[str, ...]]
 
+    _memo_rule_count: ClassVar[int] = 0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _number_memoized_rules(cls)
+
     def __init__(self, tokenizer: Tokenizer, *, verbose: bool = False):
-        self._tokenizer = tokenizer
         self._verbose = verbose
+        # One dict per token position for calls with arguments, allocated on first use.
+        self._cache: List[Optional[Dict[Tuple[str, Tuple[Any, ...]], Tuple[Any, Mark]]]] = []
+        # One row per token position, holding a tree and end mark slot for each
+        # memoized rule.
+        self._memo: List[List[Any]] = []
+        self.attach_tokenizer(tokenizer)
+        if verbose:
+            self._bind_verbose_rules()
+
+    def _bind_verbose_rules(self) -> None:
+        """Make this instance call the logging variants of its rules."""
+        cls = type(self)
+        for name in dir(cls):
+            verbose_variant = getattr(getattr(cls, name), "_verbose_variant", None)
+            if verbose_variant is not None:
+                setattr(self, name, types.MethodType(verbose_variant, self))
+
+    def attach_tokenizer(self, tokenizer: Tokenizer) -> None:
+        """Prepare the parser for parsing from *tokenizer*.
+
+        Any state left over from a previous parse is discarded.  Subclasses
+        holding per-parse state of their own should extend this.
+        """
+        self._tokenizer = tokenizer
         self._level = 0
-        self._cache: Dict[Tuple[Mark, str, Tuple[Any, ...]], Tuple[Any, Mark]] = {}
+        self._cache.clear()
+        self._memo.clear()
         # Integer tracking wether we are in a left recursive rule or not. Can be useful
         # for error reporting.
         self.in_recursive_rule = 0
@@ -175,6 +419,16 @@ class Parser:
         self._mark = self._tokenizer.mark
         self._reset = self._tokenizer.reset
 
+    def detach_tokenizer(self) -> None:
+        """Drop the tokenizer and everything memoized from it.
+
+        The parser cannot be used again until ``attach_tokenizer`` is called.
+        Subclasses that extend ``attach_tokenizer`` should extend this too.
+        """
+        self._cache.clear()
+        self._memo.clear()
+        del self._tokenizer, self._mark, self._reset
+
     @abstractmethod
     def start(self) -> Any:
         pass
@@ -183,63 +437,100 @@ class Parser:
         tok = self._tokenizer.peek()
         return f"{tok.start[0]}.{tok.start[1]}: {token.tok_name[tok.type]}:{tok.string!r}"
 
-    @memoize
+    @logger
     def name(self) -> Optional[tokenize.TokenInfo]:
-        tok = self._tokenizer.peek()
-        if tok.type == token.NAME and tok.string not in self.KEYWORDS:
-            return self._tokenizer.getnext()
+        tokenizer = self._tokenizer
+        tok = tokenizer.peek()
+        if tok.type == NAME and tok.string not in self.KEYWORDS:
+            return tokenizer.getnext()
         return None
 
-    @memoize
+    @logger
     def number(self) -> Optional[tokenize.TokenInfo]:
-        tok = self._tokenizer.peek()
-        if tok.type == token.NUMBER:
-            return self._tokenizer.getnext()
+        tokenizer = self._tokenizer
+        tok = tokenizer.peek()
+        if tok.type == NUMBER:
+            return tokenizer.getnext()
         return None
 
-    @memoize
+    @logger
     def string(self) -> Optional[tokenize.TokenInfo]:
-        tok = self._tokenizer.peek()
-        if tok.type == token.STRING:
-            return self._tokenizer.getnext()
+        tokenizer = self._tokenizer
+        tok = tokenizer.peek()
+        if tok.type == STRING:
+            return tokenizer.getnext()
         return None
 
-    @memoize
+    @logger
     def op(self) -> Optional[tokenize.TokenInfo]:
-        tok = self._tokenizer.peek()
-        if tok.type == token.OP:
-            return self._tokenizer.getnext()
+        tokenizer = self._tokenizer
+        tok = tokenizer.peek()
+        if tok.type == OP:
+            return tokenizer.getnext()
         return None
 
-    @memoize
+    @logger
     def type_comment(self) -> Optional[tokenize.TokenInfo]:
-        tok = self._tokenizer.peek()
-        if tok.type == token.TYPE_COMMENT:
-            return self._tokenizer.getnext()
+        tokenizer = self._tokenizer
+        tok = tokenizer.peek()
+        if tok.type == TYPE_COMMENT:
+            return tokenizer.getnext()
         return None
 
-    @memoize
+    @logger
     def soft_keyword(self) -> Optional[tokenize.TokenInfo]:
-        tok = self._tokenizer.peek()
-        if tok.type == token.NAME and tok.string in self.SOFT_KEYWORDS:
-            return self._tokenizer.getnext()
+        tokenizer = self._tokenizer
+        tok = tokenizer.peek()
+        if tok.type == NAME and tok.string in self.SOFT_KEYWORDS:
+            return tokenizer.getnext()
         return None
 
-    @memoize
+    @logger
     def expect(self, type: str) -> Optional[tokenize.TokenInfo]:
-        tok = self._tokenizer.peek()
-        if tok.string == type:
-            return self._tokenizer.getnext()
-        if type in exact_token_types:
-            if tok.type == exact_token_types[type]:
-                return self._tokenizer.getnext()
-        if type in token.__dict__:
-            if tok.type == token.__dict__[type]:
-                return self._tokenizer.getnext()
-        if tok.type == token.OP and tok.string == type:
-            return self._tokenizer.getnext()
+        tokenizer = self._tokenizer
+        tok = tokenizer.peek()
+        token_type = _EXPECT_BY_TYPE.get(type)
+        if token_type is None:
+            matched = tok.string == type
+        else:
+            matched = tok.type == token_type
+        if matched:
+            return tokenizer.getnext()
         return None
 
+    @staticmethod
+    def _bind_expect(type: str) -> Callable[["Parser"], Optional[tokenize.TokenInfo]]:
+        """Build a rule matching the same tokens as ``expect(type)``.
+
+        Generated parsers bind one of these per literal, so the token type
+        lookup done by ``expect`` happens once, when the class is created.
+        """
+        method: Callable[[Parser], Optional[tokenize.TokenInfo]]
+        if type in _EXPECT_BY_TYPE:
+            token_type = _EXPECT_BY_TYPE[type]
+
+            def method(self: Parser) -> Optional[tokenize.TokenInfo]:
+                tokenizer = self._tokenizer
+                if tokenizer.peek().type == token_type:
+                    return tokenizer.getnext()
+                return None
+
+        else:
+
+            def method(self: Parser) -> Optional[tokenize.TokenInfo]:
+                tokenizer = self._tokenizer
+                if tokenizer.peek().string == type:
+                    return tokenizer.getnext()
+                return None
+
+        def verbose_method(self: Parser) -> Optional[tokenize.TokenInfo]:
+            # Logs in the same format as the generic rule: expect('(') ...
+            return self.expect(type)
+
+        method.__name__ = "expect"
+        method._verbose_variant = verbose_method  # type: ignore
+        return method
+
     def expect_forced(self, res: Any, expectation: str) -> Optional[tokenize.TokenInfo]:
         if res is None:
             raise self.make_syntax_error(f"expected {expectation}")
@@ -261,6 +552,69 @@ class Parser:
         tok = self._tokenizer.diagnose()
         return SyntaxError(message, (filename, tok.start[0], 1 + tok.start[1], tok.line))
 
+    def cache_size(self) -> int:
+        """Return the number of memoized results."""
+        return sum(len(entries) for entries in self._cache if entries) + sum(
+            (len(row) - row.count(_MISS)) // 2 for row in self._memo
+        )
+
+    def _cache_at(self, mark: Mark) -> Dict[Tuple[str, Tuple[Any, ...]], Tuple[Any, Mark]]:
+        cache = self._cache
+        if mark >= len(cache):
+            cache.extend([None] * (mark + 1 - len(cache)))
+        entries = cache[mark]
+        if entries is None:
+            entries = cache[mark] = {}
+        return entries
+
+    def _memo_row(self, mark: Mark) -> List[Any]:
+        memo = self._memo
+        while len(memo) <= mark:
+            # Two slots per rule, plus the guard pair used by unnumbered rules.
+            memo.append([_MISS] * (2 * self._memo_rule_count + 2))
+        return memo[mark]
+
+    def _left_rec_entry(self, mark: Mark, method_name: str) -> List[Any]:
+        """Return the [tree, endmark] entry of a left-recursive rule without a memo slot."""
+        entries = self._cache_at(mark)
+        key = method_name, ()
+        entry: Any = entries.get(key)
+        if entry is None:
+            entry = entries[key] = [_MISS, _MISS]  # type: ignore
+        return entry
+
+
+_number_memoized_rules(Parser)
+
+
+class ParserPool(Generic[P]):
+    """Reuse parser instances of one class across many parses.
+
+    Every parser is created with the keyword arguments given to the pool,
+    so reused and fresh parsers behave the same.  A parser handed out by
+    ``acquire`` belongs to the caller until it is given back with
+    ``release``, which drops its tokenizer and memo so idle parsers do not
+    keep the last parse alive.
+    """
+
+    def __init__(self, parser_class: Type[P], **parser_kwargs: Any):
+        self._parser_class = parser_class
+        self._parser_kwargs = parser_kwargs
+        self._free: List[P] = []
+
+    def acquire(self, tokenizer: Tokenizer) -> P:
+        if self._free:
+            parser = self._free.pop()
+            parser.attach_tokenizer(tokenizer)
+            return parser
+        return self._parser_class(tokenizer, **self._parser_kwargs)
+
+    def release(self, parser: P) -> None:
+        if any(free is parser for free in self._free):
+            raise ValueError("parser was already released to this pool")
+        parser.detach_tokenizer()
+        self._free.append(parser)
+
 
 def simple_parser_main(parser_class: Type[Parser]) -> None:
     argparser = argparse.ArgumentParser()
@@ -292,6 +646,7 @@ def simple_parser_main(parser_class: Type[Parser]) -> None:
     try:
         tokengen = tokenize.generate_tokens(file.readline)
         tokenizer = Tokenizer(tokengen, verbose=verbose_tokenizer)
+        tokenizer.prime_all()
         parser = parser_class(tokenizer, verbose=verbose_parser)
         tree = parser.start()
         try:
@@ -330,5 +685,5 @@ def simple_parser_main(parser_class: Type[Parser]) -> None:
             print()
         print("Caches sizes:")
         print(f"  token array : {len(tokenizer._tokens):10}")
-        print(f"        cache : {len(parser._cache):10}")
+        print(f"        cache : {parser.cache_size():10}")
         ## print_memstats()
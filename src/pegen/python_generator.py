@@ -24,6 +24,7 @@ from pegen.grammar import (
     StringLeaf,
 )
 from pegen.parser_generator import ParserGenerator
+from pegen.tokenizer import exact_token_types
 
 MODULE_PREFIX = """\
 #!/usr/bin/env python3.8
@@ -97,6 +98,19 @@ class PythonCallMakerVisitor(GrammarVisitor):
         self.cache: Dict[Any, Any] = {}
         self.keywords: Set[str] = set()
         self.soft_keywords: Set[str] = set()
+        # Maps the name of each specialized expect method to its literal.
+        self.expectations: Dict[str, str] = {}
+
+    def expect_call(self, type: str) -> str:
+        if type in exact_token_types:
+            name = f"_expect_{token.tok_name[exact_token_types[type]]}"
+        elif type.isidentifier():
+            name = f"_expect_{type}"
+        else:
+            return f"self.expect({type!r})"
+        if self.expectations.setdefault(name, type) != type:
+            return f"self.expect({type!r})"
+        return f"self.{name}()"
 
     def visit_NameLeaf(self, node: NameLeaf) -> Tuple[Optional[str], str]:
         name = node.value
@@ -107,7 +121,7 @@ class PythonCallMakerVisitor(GrammarVisitor):
             return name, f"self.{name}()"
         if name in ("NEWLINE", "DEDENT", "INDENT", "ENDMARKER", "ASYNC", "AWAIT"):
             # Avoid using names that can be Python keywords
-            return "_" + name.lower(), f"self.expect({name!r})"
+            return "_" + name.lower(), self.expect_call(name)
         return name, f"self.{name}()"
 
     def visit_StringLeaf(self, node: StringLeaf) -> Tuple[str, str]:
@@ -117,7 +131,7 @@ class PythonCallMakerVisitor(GrammarVisitor):
                 self.keywords.add(val)
             else:
                 self.soft_keywords.add(val)
-        return "literal", f"self.expect({node.value})"
+        return "literal", self.expect_call(val)
 
     def visit_Rhs(self, node: Rhs) -> Tuple[Optional[str], str]:
         if node in self.cache:
@@ -140,15 +154,17 @@ class PythonCallMakerVisitor(GrammarVisitor):
         head, tail = call.split("(", 1)
         assert tail[-1] == ")"
         tail = tail[:-1]
+        if tail:
+            head = f"{head}, "
         return head, tail
 
     def visit_PositiveLookahead(self, node: PositiveLookahead) -> Tuple[None, str]:
         head, tail = self.lookahead_call_helper(node)
-        return None, f"self.positive_lookahead({head}, {tail})"
+        return None, f"self.positive_lookahead({head}{tail})"
 
     def visit_NegativeLookahead(self, node: NegativeLookahead) -> Tuple[None, str]:
         head, tail = self.lookahead_call_helper(node)
-        return None, f"self.negative_lookahead({head}, {tail})"
+        return None, f"self.negative_lookahead({head}{tail})"
 
     def visit_Opt(self, node: Opt) -> Tuple[str, str]:
         name, call = self.visit(node.node)
@@ -191,11 +207,14 @@ class PythonCallMakerVisitor(GrammarVisitor):
         if isinstance(node.node, Group):
             _, val = self.visit(node.node.rhs)
             return "forced", f"self.expect_forced({val}, '''({node.node.rhs!s})''')"
-        else:
+        elif isinstance(node.node, StringLeaf):
             return (
                 "forced",
-                f"self.expect_forced(self.expect({node.node.value}), {node.node.value!r})",
+                f"self.expect_forced({self.expect_call(ast.literal_eval(node.node.value))}, {node.node.value!r})",
             )
+        else:
+            _, val = self.visit(node.node)
+            return "forced", f"self.expect_forced({val}, {node.node.value!r})"
 
 
 class PythonParserGenerator(ParserGenerator, GrammarVisitor):
@@ -237,6 +256,11 @@ class PythonParserGenerator(ParserGenerator, GrammarVisitor):
 
         self.print()
         with self.indent():
+            expectations = self.callmakervisitor.expectations
+            for name, type in sorted(expectations.items()):
+                self.print(f"{name} = Parser._bind_expect({type!r})")
+            if expectations:
+                self.print()
             self.print(f"KEYWORDS = {tuple(sorted(self.callmakervisitor.keywords))}")
             self.print(f"SOFT_KEYWORDS = {tuple(sorted(self.callmakervisitor.soft_keywords))}")
 
@@ -6,6 +6,14 @@ Mark = int  # NewType('Mark', int)
 
 exact_token_types = token.EXACT_TOKEN_TYPES
 
+# Token types dropped by Tokenizer.peek(); ERRORTOKEN only when it is whitespace.
+_SKIP_MASK = 1 << tokenize.NL | 1 << tokenize.COMMENT | 1 << token.ERRORTOKEN
+
+
+def _raise_when_reached(error: Exception) -> Iterator[tokenize.TokenInfo]:
+    raise error
+    yield  # Makes this a generator, so nothing is raised until next() is called.
+
 
 def shorttok(tok: tokenize.TokenInfo) -> str:
     return "%-25.25s" % f"{tok.start[0]}.{tok.start[1]}: {token.tok_name[tok.type]}:{tok.string!r}"
@@ -25,16 +33,18 @@ class Tokenizer:
         self._tokengen = tokengen
         self._tokens = []
         self._index = 0
+        # Number of tokens the parser has looked at; may trail len(_tokens)
+        # after prime_all().
+        self._fetched = 0
         self._verbose = verbose
-        self._lines: Dict[int, str] = {}
         self._path = path
         if verbose:
             self.report(False, False)
 
     def getnext(self) -> tokenize.TokenInfo:
         """Return the next token and updates the index."""
-        cached = not self._index == len(self._tokens)
-        tok = self.peek()
+        cached = self._index < self._fetched
+        tok = self._tokens[self._index] if cached else self._fetch()
         self._index += 1
         if self._verbose:
             self.report(cached, False)
@@ -42,27 +52,54 @@ class Tokenizer:
 
     def peek(self) -> tokenize.TokenInfo:
         """Return the next token *without* updating the index."""
+        if self._index < self._fetched:
+            return self._tokens[self._index]
+        return self._fetch()
+
+    def _fetch(self) -> tokenize.TokenInfo:
+        """Make the token at the index available, tokenizing more input if needed."""
         while self._index == len(self._tokens):
             tok = next(self._tokengen)
-            if tok.type in (tokenize.NL, tokenize.COMMENT):
-                continue
-            if tok.type == token.ERRORTOKEN and tok.string.isspace():
-                continue
-            if (
-                tok.type == token.NEWLINE
+            tok_type = tok.type
+            if 1 << tok_type & _SKIP_MASK:
+                if tok_type != token.ERRORTOKEN or tok.string.isspace():
+                    continue
+            elif (
+                tok_type == token.NEWLINE
                 and self._tokens
                 and self._tokens[-1].type == token.NEWLINE
             ):
                 continue
             self._tokens.append(tok)
-            if not self._path:
-                self._lines[tok.start[0]] = tok.line
+        self._fetched = self._index + 1
         return self._tokens[self._index]
 
+    def prime_all(self) -> None:
+        """Tokenize the rest of the input up front.
+
+        Afterwards ``peek`` and ``getnext`` never call the tokenize module.
+        If it fails, the tokens before the error are kept and the error is
+        raised only when parsing reaches that position, as it would be
+        without priming.
+        """
+        index = self._index
+        fetched = self._fetched
+        try:
+            while True:
+                self._index = len(self._tokens)
+                self._fetch()
+        except StopIteration:
+            pass
+        except (tokenize.TokenError, SyntaxError) as error:
+            self._tokengen = _raise_when_reached(error)
+        finally:
+            self._index = index
+            self._fetched = fetched
+
     def diagnose(self) -> tokenize.TokenInfo:
-        if not self._tokens:
+        if not self._fetched:
             self.getnext()
-        return self._tokens[-1]
+        return self._tokens[self._fetched - 1]
 
     def get_last_non_whitespace_token(self) -> tokenize.TokenInfo:
         for tok in reversed(self._tokens[: self._index]):
@@ -74,11 +111,9 @@ class Tokenizer:
 
     def get_lines(self, line_numbers: List[int]) -> List[str]:
         """Retrieve source lines corresponding to line numbers."""
-        if self._lines:
-            lines = self._lines
-        else:
+        lines: Dict[int, str] = {}
+        if self._path:
             n = len(line_numbers)
-            lines = {}
             count = 0
             seen = 0
             with open(self._path) as f:
@@ -89,6 +124,15 @@ class Tokenizer:
                         lines[count] = l
                         if seen == n:
                             break
+        else:
+            # Use the line of the last token starting on each wanted line.
+            wanted = set(line_numbers)
+            for tok in reversed(self._tokens):
+                lineno = tok.start[0]
+                if lineno in wanted and lineno not in lines:
+                    lines[lineno] = tok.line
+                    if len(lines) == len(wanted):
+                        break
 
         return [lines[n] for n in line_numbers]
 
@@ -2,6 +2,7 @@ import ast
 import difflib
 import io
 import textwrap
+import tokenize
 from tokenize import NAME, NEWLINE, NUMBER, OP, TokenInfo
 from typing import Any, Dict, Type
 
@@ -9,8 +10,9 @@ import pytest  # type: ignore
 
 from pegen.grammar import Grammar, GrammarError
 from pegen.grammar_parser import GeneratedParser as GrammarParser
-from pegen.parser import Parser
+from pegen.parser import Parser, ParserPool, memoize, memoize_left_rec
 from pegen.python_generator import PythonParserGenerator
+from pegen.tokenizer import Tokenizer
 
 from .utils import generate_parser, make_parser, parse_string
 
@@ -612,6 +614,44 @@ def test_forced_with_group() -> None:
     assert "expected (':' | ';')" in e.value.args[0]
 
 
+def test_forced_name() -> None:
+    grammar = """
+    start: NAME &&NEWLINE
+    """
+    parser_class = make_parser(grammar)
+    assert parse_string("number\n", parser_class, verbose=True)
+    with pytest.raises(SyntaxError) as e:
+        parse_string("a b\n", parser_class, verbose=True)
+
+    assert "expected NEWLINE" in e.value.args[0]
+
+
+def test_syntax_error_location_after_prime_all() -> None:
+    grammar = """
+    start: sum NEWLINE
+    sum: sum '+' term | term
+    term: NUMBER
+    """
+    parser_class = make_parser(grammar)
+    source = "1 + * 3\n\n\n\n"
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+    tokenizer.prime_all()
+    parser = parser_class(tokenizer)
+    assert parser.start() is None
+    err = parser.make_syntax_error("invalid syntax")
+    assert (err.lineno, err.offset, err.text) == (1, 5, "1 + * 3\n")
+
+
+def test_syntax_error_before_tokenize_error_after_prime_all() -> None:
+    parser_class = make_parser("start: sum NEWLINE\nsum: sum '+' term | term\nterm: NUMBER")
+    source = '1 + \nx = """unterminated\n'
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+    tokenizer.prime_all()
+    parser = parser_class(tokenizer)
+    assert parser.start() is None
+    assert parser.make_syntax_error("invalid syntax").lineno == 1
+
+
 def test_unreachable_explicit() -> None:
     source = """
     start: NAME { UNREACHABLE }
@@ -691,3 +731,224 @@ def test_keywords() -> None:
     parser_class = make_parser(grammar)
     assert parser_class.KEYWORDS == ("five", "four", "one", "three", "two")
     assert parser_class.SOFT_KEYWORDS == ("eight", "nine", "seven", "six", "ten")
+
+
+def test_memo_subclass_rules() -> None:
+    grammar = """
+    start: sum NEWLINE
+    sum: sum '+' term | term
+    term: NUMBER
+    """
+    parser_class = make_parser(grammar)
+
+    class SubParser(parser_class):  # type: ignore
+        @memoize
+        def term(self) -> Any:
+            return self.name() or super().term()
+
+    ids = {getattr(SubParser, name)._rule_id for name in ("start", "sum", "term")}
+    assert len(ids) == 3
+    assert SubParser._memo_rule_count == parser_class._memo_rule_count + 1
+    node = parse_string("a + 1\n", SubParser)
+    assert node[0][0].string == "a"
+    assert node[0][2].string == "1"
+
+
+def test_memo_multiple_inheritance() -> None:
+    class A(Parser):
+        KEYWORDS = ()
+
+        @memoize
+        def a(self) -> Any:
+            return self.name()
+
+    class B(Parser):
+        @memoize
+        def b(self) -> Any:
+            return self.number()
+
+    class C(A, B):
+        pass
+
+    parser = C(Tokenizer(tokenize.generate_tokens(io.StringIO("x").readline)))
+    assert parser.a().string == "x"
+    parser._reset(0)
+    assert parser.b() is None
+
+
+def test_memo_multiple_inheritance_super() -> None:
+    class A(Parser):
+        KEYWORDS = ()
+
+        @memoize
+        def a(self) -> Any:
+            return self.name()
+
+    class B(Parser):
+        @memoize
+        def b(self) -> Any:
+            return self.number()
+
+    class C(A, B):
+        @memoize
+        def b(self) -> Any:
+            return super().b()
+
+    assert len({C.a._rule_id, C.b._rule_id, B.b._rule_id}) == 3  # type: ignore
+    parser = C(Tokenizer(tokenize.generate_tokens(io.StringIO("x").readline)))
+    assert parser.a().string == "x"
+    parser._reset(0)
+    assert parser.b() is None
+
+
+def test_memo_rule_count_is_per_class() -> None:
+    grammar = "start: NUMBER NEWLINE"
+    count = make_parser(grammar)._memo_rule_count
+    for _ in range(3):
+        make_parser("start: sum NEWLINE\nsum: sum '+' term | term\nterm: NUMBER")
+    assert make_parser(grammar)._memo_rule_count == count
+
+
+def test_memo_mixin_rules() -> None:
+    class Mixin:
+        @memoize
+        def m(self) -> Any:
+            return self.number()  # type: ignore
+
+    class D(Mixin, Parser):
+        KEYWORDS = ()
+
+        @memoize
+        def d(self) -> Any:
+            return self.name()
+
+    parser = D(Tokenizer(tokenize.generate_tokens(io.StringIO("x").readline)))
+    assert parser.d().string == "x"
+    parser._reset(0)
+    assert parser.m() is None
+    assert D._memo_rule_count > max(D.m._rule_id, D.d._rule_id)  # type: ignore
+
+
+def test_memo_late_rules() -> None:
+    class E(Parser):
+        KEYWORDS = ()
+
+    calls = []
+
+    def late(self: Any) -> Any:
+        calls.append(self._mark())
+        return self.name()
+
+    def late_sum(self: Any) -> Any:
+        mark = self._mark()
+        if (left := self.late_sum()) and self.expect("+") and (right := self.number()):
+            return [left, right]
+        self._reset(mark)
+        return self.number()
+
+    # Attached after the class was created, so neither has a memo slot.
+    E.late = memoize(late)  # type: ignore
+    E.late_sum = memoize_left_rec(late_sum)  # type: ignore
+    for verbose in (False, True):
+        source = io.StringIO("x 1 + 2 + 3")
+        parser = E(Tokenizer(tokenize.generate_tokens(source.readline)), verbose=verbose)
+        assert parser.late().string == "x"  # type: ignore
+        parser._reset(0)
+        assert parser.late().string == "x"  # type: ignore
+        assert calls == [0]
+        calls.clear()
+        node = parser.late_sum()  # type: ignore
+        assert [[node[0][0].string, node[0][1].string], node[1].string] == [["1", "2"], "3"]
+        assert parser.cache_size() == 2
+
+
+def test_specialized_expect() -> None:
+    grammar = """
+    start: 'if' NAME ':' NEWLINE $
+    """
+    parser_class = make_parser(grammar)
+    for name in ("_expect_if", "_expect_COLON", "_expect_NEWLINE", "_expect_ENDMARKER"):
+        assert callable(getattr(parser_class, name))
+    node = parse_string("if x:\n", parser_class)
+    assert [tok.string for tok in node[:3]] == ["if", "x", ":"]
+    with pytest.raises(SyntaxError):
+        parse_string("if x;\n", parser_class)
+
+
+def test_parser_pool() -> None:
+    parser_class = make_parser("start: NUMBER+ NEWLINE")
+    pool = ParserPool(parser_class)
+    results = []
+    parsers = []
+    for source in ("1 2\n", "3\n", "x\n"):
+        tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline))
+        parser = pool.acquire(tokenizer)
+        results.append(parser.start())
+        parsers.append(parser)
+        pool.release(parser)
+        assert parser.cache_size() == 0
+        assert not hasattr(parser, "_tokenizer")
+    assert parsers[0] is parsers[1] is parsers[2]
+    assert [tok.string for tok in results[0][0]] == ["1", "2"]
+    assert [tok.string for tok in results[1][0]] == ["3"]
+    assert results[2] is None
+
+
+def test_parser_pool_kwargs() -> None:
+    parser_class = make_parser("start: NUMBER NEWLINE")
+
+    class NamedParser(parser_class):  # type: ignore
+        def __init__(self, tokenizer: Tokenizer, *, filename: str, **kwargs: Any):
+            super().__init__(tokenizer, **kwargs)
+            self.filename = filename
+
+    pool = ParserPool(NamedParser, filename="x.py", verbose=True)
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO("1\n").readline))
+    parser = pool.acquire(tokenizer)
+    assert parser.filename == "x.py"
+    assert parser._verbose
+
+
+def test_parser_pool_double_release() -> None:
+    pool = ParserPool(make_parser("start: NUMBER NEWLINE"))
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO("1\n").readline))
+    parser = pool.acquire(tokenizer)
+    pool.release(parser)
+    with pytest.raises(ValueError, match="already released"):
+        pool.release(parser)
+    assert pool.acquire(tokenizer) is parser
+
+
+def test_specialized_expect_token_name() -> None:
+    parser_class = make_parser("start: NAME* NEWLINE $")
+    tokenizer = Tokenizer(tokenize.generate_tokens(io.StringIO("NEWLINE\n").readline))
+    parser = parser_class(tokenizer)
+    # A NAME token spelled like a token type is not that token.
+    assert parser._expect_NEWLINE() is None
+    assert parser.expect("NEWLINE") is None
+    assert parser.start()
+
+
+def test_expect_matches_specialized_expect() -> None:
+    parser_class = make_parser("start: NAME")
+    source = "NEWLINE if (x) NAME 1\n"
+    literals = ["NEWLINE", "NAME", "NUMBER", "ENDMARKER", "if", "x", "(", ")", "1"]
+    specialized = {literal: Parser._bind_expect(literal) for literal in literals}
+    parser = parser_class(Tokenizer(tokenize.generate_tokens(io.StringIO(source).readline)))
+    while True:
+        mark = parser._mark()
+        for literal in literals:
+            expected = specialized[literal](parser)
+            parser._reset(mark)
+            assert parser.expect(literal) == expected, (literal, mark)
+            parser._reset(mark)
+        if parser._tokenizer.getnext().type == tokenize.ENDMARKER:
+            break
+
+
+def test_specialized_expect_verbose_trace(capsys: Any) -> None:
+    parser_class = make_parser("start: '(' ')' NEWLINE")
+    parse_string("()\n", parser_class, verbose=True)
+    out = capsys.readouterr().out
+    assert "expect('(') ...." in out
+    assert "expect('NEWLINE') ...." in out
@@ -1,7 +1,9 @@
 import io
-from tokenize import NAME, NEWLINE, NUMBER, OP, TokenInfo, generate_tokens
+from tokenize import ENDMARKER, NAME, NEWLINE, NUMBER, OP, TokenError, TokenInfo, generate_tokens
 from typing import Any, Dict, Type
 
+import pytest  # type: ignore
+
 from pegen.tokenizer import Tokenizer
 
 
@@ -32,3 +34,45 @@ def test_last_non_whitespace():
     assert t.getnext() == TokenInfo(NUMBER, "1", (2, 0), (2, 1), "1\n")
     assert t.getnext() == TokenInfo(NEWLINE, "\n", (2, 1), (2, 2), "1\n")
     assert t.get_last_non_whitespace_token() == TokenInfo(NUMBER, "1", (2, 0), (2, 1), "1\n")
+
+
+def test_skipped_tokens():
+    source = io.StringIO("1  # one\n\n# comment\n2\n")
+    t = Tokenizer(generate_tokens(source.readline))
+    assert [t.getnext().type for _ in range(5)] == [NUMBER, NEWLINE, NUMBER, NEWLINE, ENDMARKER]
+
+
+def test_get_lines():
+    source = io.StringIO("a = 1\n\nb = (\n  2)\n")
+    t = Tokenizer(generate_tokens(source.readline))
+    while t.getnext().type != ENDMARKER:
+        pass
+    assert t.get_lines([4, 1, 3]) == ["  2)\n", "a = 1\n", "b = (\n"]
+
+
+def test_prime_all():
+    source = io.StringIO("1\n# comment\n2\n")
+    t = Tokenizer(generate_tokens(source.readline))
+    t.prime_all()
+    assert t.mark() == 0
+    assert [tok.type for tok in t._tokens] == [NUMBER, NEWLINE, NUMBER, NEWLINE, ENDMARKER]
+    assert t.getnext() == TokenInfo(NUMBER, "1", (1, 0), (1, 1), "1\n")
+
+
+def test_diagnose_after_prime_all():
+    source = io.StringIO("1\n2\n")
+    t = Tokenizer(generate_tokens(source.readline))
+    t.prime_all()
+    t.getnext()
+    t.peek()
+    t.reset(0)
+    assert t.diagnose() == TokenInfo(NEWLINE, "\n", (1, 1), (1, 2), "1\n")
+
+
+def test_prime_all_defers_tokenize_errors():
+    source = io.StringIO('1 +\nx = """unterminated\n')
+    t = Tokenizer(generate_tokens(source.readline))
+    t.prime_all()
+    assert [t.getnext().string for _ in range(5)] == ["1", "+", "\n", "x", "="]
+    with pytest.raises(TokenError):
+        t.peek()